@@ -1,7 +1,13 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, field
-from typing import Any, Optional
+import functools
+from collections import deque
+from dataclasses import asdict, dataclass
+from datetime import date
+from itertools import count, cycle, islice
+from typing import Any, Iterator, Optional
+
+import numpy as np
 
 from ..agent import (
     AgentContext,
@@ -11,17 +17,160 @@ from ..agent import (
     MemoryAttribute,
 )
 from ..agent.agent import CitizenAgentBase
+from ..logger import get_logger
 from ..memory import Memory
 from ..message import Message, MessageKind
 from ..tools.bridge_tools import (
+    MISSING_DUE_ORDINAL,
+    BridgeColumns,
     BridgeRecord,
-    filter_bridges_by_condition,
-    load_clean_bridge_records,
+    _condition_score,
+    _latest_bridge_file,
+    build_bridge_columns,
     propose_repair_actions,
+    propose_repair_actions_from_scored,
+    read_bridge_records,
     schedule_overdue_inspections,
 )
+from ..tools.bridge_tools_jit import prioritize
 from .monitor import bridge_monitor
 
+# Parsed inventories keyed by "<path>:<mtime>" so every agent in the process
+# shares one record list instead of re-reading the processed file.
+_RECORDS_CACHE: dict[str, tuple[float, list[BridgeRecord]]] = {}
+
+
+def _get_shared_records() -> list[BridgeRecord]:
+    """Return the newest cleaned inventory, parsing it at most once per revision."""
+
+    latest = _latest_bridge_file()
+    if latest is None:
+        return []
+    mtime, file_path = latest
+    key = f"{file_path}:{mtime}"
+    cached = _RECORDS_CACHE.get(key)
+    if cached is None:
+        # Only the newest revision is ever served; drop superseded entries.
+        # Agents still using an older list keep it registered until they
+        # close, at which point _release_inventory evicts it.
+        _RECORDS_CACHE.clear()
+        cached = (mtime, read_bridge_records(file_path))
+        _RECORDS_CACHE[key] = cached
+    return cached[1]
+
+
+# Inventories registered by bridge agents; agent memory stores only the key so
+# that status reads do not deep-copy the full record list.
+_INVENTORY_REGISTRY: dict[str, list[BridgeRecord]] = {}
+# Column views of registered inventories, built once per handle.
+_INVENTORY_COLUMNS: dict[str, BridgeColumns] = {}
+# Live agents holding each handle; an inventory is dropped when this hits zero.
+_INVENTORY_REFCOUNTS: dict[str, int] = {}
+# Handle of each registered list, so agents sharing a list share its columns.
+# Keying by id() is safe only because the registry keeps the list alive.
+_INVENTORY_HANDLES: dict[int, str] = {}
+# Handles are never reused, even across reset_shared_records().
+_INVENTORY_SEQUENCE = count(1)
+# Shared stand-in registered for inventories that are not record lists.
+_EMPTY_INVENTORY: list[BridgeRecord] = []
+# Matches the default ``lead_time_days`` of ``schedule_overdue_inspections``.
+_LEAD_TIME_DAYS = 30
+
+
+def _register_inventory(records: list[BridgeRecord]) -> str:
+    """Register ``records`` for one more agent and return its handle.
+
+    Anything other than a list (e.g. a JSON object injected as
+    ``bridge_records``) is registered as an empty inventory instead of failing
+    agent init.
+    """
+
+    if not isinstance(records, list):
+        get_logger().warning(
+            f"Ignoring bridge inventory of type {type(records).__name__}; expected a list of records"
+        )
+        records = _EMPTY_INVENTORY
+
+    inventory_id = _INVENTORY_HANDLES.get(id(records))
+    if inventory_id is None or _INVENTORY_REGISTRY.get(inventory_id) is not records:
+        inventory_id = f"inventory-{next(_INVENTORY_SEQUENCE)}"
+        _INVENTORY_HANDLES[id(records)] = inventory_id
+        _INVENTORY_REGISTRY[inventory_id] = records
+        _INVENTORY_COLUMNS[inventory_id] = build_bridge_columns(records)
+        _INVENTORY_REFCOUNTS[inventory_id] = 0
+    _INVENTORY_REFCOUNTS[inventory_id] += 1
+    return inventory_id
+
+
+def _release_inventory(inventory_id: str) -> None:
+    """Drop one agent's hold on ``inventory_id``, evicting it after the last."""
+
+    remaining = _INVENTORY_REFCOUNTS.get(inventory_id)
+    if remaining is None:
+        return
+    if remaining > 1:
+        _INVENTORY_REFCOUNTS[inventory_id] = remaining - 1
+        return
+    del _INVENTORY_REFCOUNTS[inventory_id]
+    _INVENTORY_COLUMNS.pop(inventory_id, None)
+    records = _INVENTORY_REGISTRY.pop(inventory_id, None)
+    if records is not None:
+        _INVENTORY_HANDLES.pop(id(records), None)
+    # Cached backlogs hold references into the evicted records.
+    _risky_backlog.cache_clear()
+
+
+async def _resolve_inventory(agent: Any) -> list[BridgeRecord]:
+    """Look up the inventory referenced by ``agent``'s memory handle."""
+
+    inventory_id = await agent.memory.status.get("bridge_inventory", "")
+    return _INVENTORY_REGISTRY.get(inventory_id, [])
+
+
+@functools.lru_cache(maxsize=64)
+def _risky_backlog(
+    inventory_id: str, max_score: int, today: date
+) -> tuple[dict[str, Any], ...]:
+    """Schedule the risky part of a registered inventory once per (handle, threshold, day).
+
+    Handles change whenever a new record list is registered, so cached results
+    never outlive the inventory they were computed from.
+    """
+
+    records = _INVENTORY_REGISTRY.get(inventory_id)
+    columns = _INVENTORY_COLUMNS.get(inventory_id)
+    if records is None or columns is None:
+        return ()
+
+    today_ordinal = today.toordinal()
+    due_ordinals = np.where(
+        columns.due_ordinals == MISSING_DUE_ORDINAL, today_ordinal, columns.due_ordinals
+    ).astype(np.int64)
+    days_overdue = today_ordinal - due_ordinals
+    # NaN scores compare False, dropping records without a usable condition.
+    risky_mask = columns.condition_scores <= max_score
+    backlog_idx = np.flatnonzero(risky_mask & (days_overdue >= -_LEAD_TIME_DAYS))
+    # Ascending days_overdue as in schedule_overdue_inspections; ties go to the
+    # worse condition, then the higher risk.
+    backlog_idx = backlog_idx[
+        prioritize(
+            days_overdue[backlog_idx],
+            columns.condition_scores[backlog_idx],
+            columns.risk_codes[backlog_idx],
+        )
+    ]
+
+    return tuple(
+        {
+            "bridge": records[i],
+            "due_date": date.fromordinal(int(due_ordinals[i])),
+            "days_overdue": int(days_overdue[i]),
+            "priority_label": "overdue" if days_overdue[i] > 0 else "soon",
+            "condition_score": float(columns.condition_scores[i]),
+        }
+        for i in backlog_idx
+    )
+
 
 class BridgeTaskOutput(BlockOutput):
     """Aggregate output for bridge-related blocks."""
@@ -32,14 +181,18 @@ class BridgeTaskOutput(BlockOutput):
     dispatches: list[Message] | None = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class BridgeProfile:
     """Profile describing bridge-facing agents."""
 
     role: str
     jurisdiction: str | None = None
     specialization: str | None = None
-    crew_contacts: list[int] = field(default_factory=list)
+    crew_contacts: tuple[int, ...] = ()
+
+    def __post_init__(self) -> None:
+        # Accept any iterable of ids while keeping the profile hashable.
+        object.__setattr__(self, "crew_contacts", tuple(self.crew_contacts))
 
 
 class BridgeAgentContext(AgentContext):
@@ -55,10 +208,9 @@ class BridgeRoleBase(CitizenAgentBase):
     StatusAttributes = [
         MemoryAttribute(
             name="bridge_inventory",
-            type=list,
-            default_or_value=[],
-            description="Shared cleaned bridge records available to all bridge agents",
-            whether_embedding=True,
+            type=str,
+            default_or_value="",
+            description="Registry handle of the shared cleaned bridge records",
         ),
         MemoryAttribute(
             name="assignments",
@@ -74,6 +226,7 @@ class BridgeRoleBase(CitizenAgentBase):
         ),
     ]
     description = "Bridge maintenance specialist"
+    DEFAULT_BLOCK_CLASSES: tuple[type[Block], ...] = ()
 
     def __init__(
         self,
@@ -88,6 +241,8 @@ class BridgeRoleBase(CitizenAgentBase):
     ) -> None:
         if profile is None:
             profile = BridgeProfile(role="bridge-agent")
+        if blocks is None:
+            blocks = self._default_blocks(toolbox, memory)
         super().__init__(
             id=id,
             name=name,
@@ -98,13 +253,38 @@ class BridgeRoleBase(CitizenAgentBase):
         )
         self._bridge_profile = profile
         self._bridge_records = bridge_records
+        self._inventory_id: str | None = None
 
     async def init(self):
         await super().init()
-        await self.memory.status.update("profile", self._bridge_profile.__dict__)
+        await self.memory.status.update("profile", asdict(self._bridge_profile))
         if self._bridge_records is None:
-            self._bridge_records = load_clean_bridge_records()
-        await self.memory.status.update("bridge_inventory", self._bridge_records)
+            self._bridge_records = _get_shared_records()
+        if self._inventory_id is not None:
+            _release_inventory(self._inventory_id)
+        self._inventory_id = _register_inventory(self._bridge_records)
+        await self.memory.status.update("bridge_inventory", self._inventory_id)
+
+    async def close(self):
+        if self._inventory_id is not None:
+            _release_inventory(self._inventory_id)
+            self._inventory_id = None
+        await super().close()
+
+    @classmethod
+    def _default_blocks(cls, toolbox: AgentToolbox, memory: Memory) -> list[Block]:
+        # Blocks keep a reference to their agent, so each agent gets fresh ones.
+        return [block_cls(toolbox=toolbox, agent_memory=memory) for block_cls in cls.DEFAULT_BLOCK_CLASSES]
+
+    @classmethod
+    def reset_shared_records(cls) -> None:
+        """Drop the process-wide inventory cache so the next init re-reads disk."""
+        _RECORDS_CACHE.clear()
+        _INVENTORY_REGISTRY.clear()
+        _INVENTORY_COLUMNS.clear()
+        _INVENTORY_REFCOUNTS.clear()
+        _INVENTORY_HANDLES.clear()
+        _risky_backlog.cache_clear()
 
     @property
     def bridge_profile(self) -> BridgeProfile:
@@ -121,9 +301,8 @@ class InspectionRouteBlock(Block):
     NeedAgent = True
 
     async def forward(self, agent_context: BridgeAgentContext):
-        records = await self.agent.memory.status.get("bridge_inventory", [])
-        risky = filter_bridges_by_condition(records, max_condition_score=4)
-        backlog = schedule_overdue_inspections(risky)
+        inventory_id = await self.agent.memory.status.get("bridge_inventory", "")
+        backlog = _risky_backlog(inventory_id, 4, date.today())
         day, sim_time = self.agent.toolbox.environment.get_datetime()
         bridge_monitor.record_backlog(
             backlog,
@@ -131,21 +310,37 @@ class InspectionRouteBlock(Block):
             t=float(sim_time),
             step=self.agent.toolbox.environment.get_tick(),
         )
-        route_plan: list[dict[str, Any]] = []
-        for entry in backlog:
-            bridge = entry["bridge"]
-            route_plan.append(
-                {
-                    "bridge": bridge,
-                    "due_date": entry["due_date"],
-                    "priority": "overdue" if entry["days_overdue"] > 0 else "soon",
-                }
-            )
-        output = BridgeTaskOutput(route_plan=route_plan, inspection_backlog=backlog)
+        route_plan = [
+            {
+                "bridge": entry["bridge"],
+                "due_date": entry["due_date"],
+                "priority": entry["priority_label"],
+                "condition_score": entry["condition_score"],
+            }
+            for entry in backlog
+        ]
+        output = BridgeTaskOutput(route_plan=route_plan, inspection_backlog=list(backlog))
         agent_context.latest_output = output
         return output
 
 
+def _scored_route_stops(route_plan: list[dict[str, Any]]) -> Iterator[tuple[BridgeRecord, float]]:
+    """Pair route stops with their condition scores.
+
+    Stops from :class:`InspectionRouteBlock` carry the score parsed when the
+    inventory was indexed; stops from other producers are parsed here, and
+    those without a usable score are skipped.
+    """
+
+    for entry in route_plan:
+        bridge = entry["bridge"]
+        score = entry.get("condition_score")
+        if score is None:
+            score = _condition_score(bridge)
+        if score is not None:
+            yield bridge, score
+
+
 class ConditionReasoningBlock(Block):
     """Reason about condition codes and propose repairs."""
 
@@ -157,12 +352,10 @@ class ConditionReasoningBlock(Block):
 
     async def forward(self, agent_context: BridgeAgentContext):
         route_output = agent_context.latest_output
-        candidate_records: list[BridgeRecord]
         if route_output and route_output.route_plan:
-            candidate_records = [entry["bridge"] for entry in route_output.route_plan]
+            proposals = propose_repair_actions_from_scored(_scored_route_stops(route_output.route_plan))
         else:
-            candidate_records = await self.agent.memory.status.get("bridge_inventory", [])
-        proposals = propose_repair_actions(candidate_records)
+            proposals = propose_repair_actions(await _resolve_inventory(self.agent))
         day, sim_time = self.agent.toolbox.environment.get_datetime()
         bridge_monitor.record_inspection_findings(
             proposals,
@@ -170,11 +363,8 @@ class ConditionReasoningBlock(Block):
             t=float(sim_time),
             step=self.agent.toolbox.environment.get_tick(),
         )
-        output = BridgeTaskOutput(
-            route_plan=route_output.route_plan if route_output else None,
-            inspection_backlog=route_output.inspection_backlog if route_output else None,
-            repair_proposals=proposals,
-        )
+        output = route_output or BridgeTaskOutput()
+        output.repair_proposals = proposals
         agent_context.latest_output = output
         return output
 
@@ -192,11 +382,15 @@ class RepairDispatchBlock(Block):
         proposals = []
         if agent_context.latest_output and agent_context.latest_output.repair_proposals:
             proposals = agent_context.latest_output.repair_proposals
-        crew_contacts: list[int] = self.agent.bridge_profile.crew_contacts
-        dispatches: list[Message] = []
-        for idx, proposal in enumerate(proposals):
-            target = crew_contacts[idx % len(crew_contacts)] if crew_contacts else None
-            day, sim_time = self.agent.toolbox.environment.get_datetime()
+        crew_contacts: tuple[int, ...] = self.agent.bridge_profile.crew_contacts
+        targets: list[int | None] = (
+            list(islice(cycle(crew_contacts), len(proposals)))
+            if crew_contacts
+            else [None] * len(proposals)
+        )
+        day, sim_time = self.agent.toolbox.environment.get_datetime()
+        step = self.agent.toolbox.environment.get_tick()
+        for target, proposal in zip(targets, proposals):
             bridge_monitor.record_intervention(
                 proposal.get("bridge", {}),
                 priority=str(proposal.get("priority")) if proposal.get("priority") else None,
@@ -204,29 +398,31 @@ class RepairDispatchBlock(Block):
                 assigned_to=target,
                 day=day,
                 t=float(sim_time),
-                step=self.agent.toolbox.environment.get_tick(),
+                step=step,
             )
-            dispatches.append(
-                Message(
-                    from_id=self.agent.id,
-                    to_id=target,
-                    day=0,
-                    t=0.0,
-                    kind=MessageKind.AGENT_CHAT,
-                    payload={
-                        "type": "repair-request",
-                        "bridge": proposal.get("bridge"),
-                        "priority": proposal.get("priority"),
-                        "action": proposal.get("recommended_action"),
-                    },
-                )
+        dispatches = [
+            Message(
+                from_id=self.agent.id,
+                to_id=target,
+                day=day,
+                t=float(sim_time),
+                kind=MessageKind.AGENT_CHAT,
+                payload={
+                    "type": "repair-request",
+                    "bridge": proposal.get("bridge"),
+                    "priority": proposal.get("priority"),
+                    "action": proposal.get("recommended_action"),
+                },
             )
-        output = BridgeTaskOutput(
-            route_plan=agent_context.latest_output.route_plan if agent_context.latest_output else None,
-            inspection_backlog=agent_context.latest_output.inspection_backlog if agent_context.latest_output else None,
-            repair_proposals=proposals,
-            dispatches=dispatches,
-        )
+            for target, proposal in zip(targets, proposals)
+        ]
+        messager = self.agent.toolbox.messager
+        addressed = [message for message in dispatches if message.to_id is not None]
+        if messager is not None and addressed:
+            await messager.send_messages(addressed)
+        output = agent_context.latest_output or BridgeTaskOutput()
+        output.repair_proposals = proposals
+        output.dispatches = dispatches
         agent_context.latest_output = output
         return output
 
@@ -241,7 +437,7 @@ class InspectionSchedulerBlock(Block):
     NeedAgent = True
 
     async def forward(self, agent_context: BridgeAgentContext):
-        records = await self.agent.memory.status.get("bridge_inventory", [])
+        records = await _resolve_inventory(self.agent)
         backlog = schedule_overdue_inspections(records)
         output = BridgeTaskOutput(inspection_backlog=backlog)
         agent_context.latest_output = output
@@ -258,26 +454,31 @@ class CrewActionBlock(Block):
     NeedAgent = True
 
     async def forward(self, agent_context: BridgeAgentContext):
-        pending_messages = await self.agent.toolbox.messager.fetch_received_messages()
-        repair_messages = [msg for msg in pending_messages if msg.payload.get("type") == "repair-request"]
+        pending_messages = self.agent.drain_inbox()
+        repair_messages: list[Message] = []
         tasks: list[dict[str, Any]] = []
-        for msg in repair_messages:
+        for msg in pending_messages:
+            payload = msg.payload
+            if payload.get("type") != "repair-request":
+                continue
+            repair_messages.append(msg)
             tasks.append(
                 {
-                    "bridge": msg.payload.get("bridge"),
-                    "priority": msg.payload.get("priority", "routine"),
-                    "action": msg.payload.get("action"),
+                    "bridge": payload.get("bridge"),
+                    "priority": payload.get("priority", "routine"),
+                    "action": payload.get("action"),
                     "requested_by": msg.from_id,
                 }
             )
         if tasks:
             day, sim_time = self.agent.toolbox.environment.get_datetime()
+            step = self.agent.toolbox.environment.get_tick()
             for task in tasks:
                 bridge_monitor.record_work_order_status(
                     task,
                     day=day,
                     t=float(sim_time),
-                    step=self.agent.toolbox.environment.get_tick(),
+                    step=step,
                 )
         output = BridgeTaskOutput(dispatches=repair_messages, repair_proposals=tasks)
         agent_context.latest_output = output
@@ -288,6 +489,7 @@ class BridgeInspectorAgent(BridgeRoleBase):
     """Inspector agent that plans routes and dispatches repair requests."""
 
     description = "Bridge inspector that triages risky bridges and alerts crews"
+    DEFAULT_BLOCK_CLASSES = (InspectionRouteBlock, ConditionReasoningBlock, RepairDispatchBlock)
 
     def __init__(
         self,
@@ -300,12 +502,6 @@ class BridgeInspectorAgent(BridgeRoleBase):
         profile: Optional[BridgeProfile] = None,
         bridge_records: Optional[list[BridgeRecord]] = None,
     ) -> None:
-        if blocks is None:
-            blocks = [
-                InspectionRouteBlock(toolbox=toolbox, agent_memory=memory),
-                ConditionReasoningBlock(toolbox=toolbox, agent_memory=memory),
-                RepairDispatchBlock(toolbox=toolbox, agent_memory=memory),
-            ]
         super().__init__(
             id=id,
             name=name,
@@ -322,6 +518,7 @@ class MaintenanceSchedulerAgent(BridgeRoleBase):
     """Scheduler that manages inspection backlogs."""
 
     description = "Bridge maintenance scheduler prioritizing overdue inspections"
+    DEFAULT_BLOCK_CLASSES = (InspectionSchedulerBlock,)
 
     def __init__(
         self,
@@ -334,8 +531,6 @@ class MaintenanceSchedulerAgent(BridgeRoleBase):
         profile: Optional[BridgeProfile] = None,
         bridge_records: Optional[list[BridgeRecord]] = None,
     ) -> None:
-        if blocks is None:
-            blocks = [InspectionSchedulerBlock(toolbox=toolbox, agent_memory=memory)]
         super().__init__(
             id=id,
             name=name,
@@ -352,6 +547,7 @@ class FieldCrewAgent(BridgeRoleBase):
     """Field crew that executes repair requests."""
 
     description = "Bridge field crew converting dispatch messages into actions"
+    DEFAULT_BLOCK_CLASSES = (CrewActionBlock,)
 
     def __init__(
         self,
@@ -364,8 +560,6 @@ class FieldCrewAgent(BridgeRoleBase):
         profile: Optional[BridgeProfile] = None,
         bridge_records: Optional[list[BridgeRecord]] = None,
     ) -> None:
-        if blocks is None:
-            blocks = [CrewActionBlock(toolbox=toolbox, agent_memory=memory)]
         super().__init__(
             id=id,
             name=name,
@@ -376,6 +570,24 @@ class FieldCrewAgent(BridgeRoleBase):
             profile=profile or BridgeProfile(role="field-crew"),
             bridge_records=bridge_records,
         )
+        # Repair requests pushed by the simulation's message dispatch, drained
+        # by CrewActionBlock on the next forward.
+        self._inbox: deque[Message] = deque()
+
+    async def do_chat(self, message: Message) -> str:
+        if message.payload.get("type") == "repair-request":
+            self._inbox.append(message)
+        return await super().do_chat(message)
+
+    def drain_inbox(self) -> list[Message]:
+        """Return and clear the repair requests received since the last call."""
+        messages = list(self._inbox)
+        self._inbox.clear()
+        return messages
+
+    async def close(self):
+        self._inbox.clear()
+        await super().close()
 
 
 __all__ = [
@@ -7,10 +7,12 @@ metrics and visualization overlays.
 
 from __future__ import annotations
 
+import functools
+import sys
+from array import array
 from dataclasses import dataclass, field
 from datetime import date, datetime
-from statistics import mean
-from typing import Any, Iterable, Mapping
+from typing import Any, Iterable, Mapping, Sequence
 
 from ..tools.bridge_tools import BridgeRecord
 
@@ -29,16 +31,30 @@ def _parse_int(value: object) -> int | None:
         return None
 
 
+@functools.lru_cache(maxsize=8192)
+def _isoformat(value: date) -> str:
+    # Backlog due dates repeat heavily across bridges and ticks.
+    return value.isoformat()
+
+
 def _serialize_date(value: object) -> str | None:
-    if isinstance(value, (datetime, date)):
-        return value.isoformat()
     if value is None:
         return None
+    if isinstance(value, str):
+        return value
+    if type(value) is date:
+        return _isoformat(value)
+    if isinstance(value, (datetime, date)):
+        # Equal aware datetimes in different zones hash alike, so they bypass the cache.
+        return value.isoformat()
     return str(value)
 
 
+_ID_KEYS = ("bridge_id", "structure_id", "id", "structure_number", "structure_num")
+
+
 def _extract_bridge_id(record: Mapping[str, Any]) -> str:
-    for key in ("bridge_id", "structure_id", "id", "structure_number", "structure_num"):
+    for key in _ID_KEYS:
         candidate = record.get(key)
         if candidate not in (None, ""):
             return str(candidate)
@@ -51,7 +67,15 @@ def _extract_coords(record: Mapping[str, Any]) -> tuple[float | None, float | No
     return lng, lat
 
 
-@dataclass
+def _label(value: object) -> str | None:
+    """Interned string form of a truthy label, else ``None``."""
+    return sys.intern(str(value)) if value else None
+
+
+_OPEN_STATES = frozenset({"inspection_due", "triaged", "work_order"})
+
+
+@dataclass(slots=True)
 class BridgeStatusEntry:
     """Snapshot used for visualization overlays."""
 
@@ -69,28 +93,109 @@ class BridgeStatusEntry:
     last_update: dict[str, Any] = field(default_factory=dict)
 
 
+def _is_critical_open(status: BridgeStatusEntry) -> bool:
+    return status.status in _OPEN_STATES and (status.priority or "").lower() == "critical"
+
+
+class _ColumnarLog:
+    """Append-only event log stored column by column.
+
+    Each of ``layouts`` gets its own columns, with ``day`` and ``t`` in
+    ``array.array`` buffers and the remaining fields in plain lists; dict rows
+    are only rebuilt by :meth:`to_rows`. Rows are appended positionally in
+    layout order, and the sequence of layout ids keeps a log mixing several
+    event shapes in its original order.
+    """
+
+    _TYPECODES = {"day": "i", "t": "d"}
+
+    def __init__(self, layouts: Sequence[tuple[str, ...]]) -> None:
+        self._layouts = tuple(layouts)
+        self._columns: tuple[tuple[Any, ...], ...] = tuple(
+            tuple(array(self._TYPECODES[name]) if name in self._TYPECODES else [] for name in layout)
+            for layout in self._layouts
+        )
+        self._layout_ids = bytearray()
+
+    def append(self, layout: int, *values: Any) -> None:
+        self._layout_ids.append(layout)
+        for column, value in zip(self._columns[layout], values):
+            column.append(value)
+
+    def clear(self) -> None:
+        self._layout_ids.clear()
+        for columns in self._columns:
+            for column in columns:
+                del column[:]
+
+    def to_rows(self) -> list[dict[str, Any]]:
+        rows = [zip(*columns) for columns in self._columns]
+        return [dict(zip(self._layouts[layout], next(rows[layout]))) for layout in self._layout_ids]
+
+
+_BACKLOG_INSPECTION = 0
+_FINDING_INSPECTION = 1
+_INTERVENTION = 0
+
+
 class BridgeMaintenanceMonitor:
     """Collects evaluation signals for bridge maintenance runs."""
 
     def __init__(self) -> None:
         self._backlog_history: list[tuple[int, int]] = []
+        self._backlog_initial: int | None = None
         self._pending_backlog_step: dict[str, int] = {}
-        self._response_times: list[int] = []
-        self._mitigated_bridges: set[str] = set()
-        self._interventions: list[dict[str, Any]] = []
-        self._inspections: list[dict[str, Any]] = []
+        self._response_time_sum: int = 0
+        self._response_time_count: int = 0
+        # Bridges get a dense index when first tracked; mitigation is a bit
+        # per index rather than a set of id strings.
+        self._bridge_index: dict[str, int] = {}
+        self._mitigated_bits = bytearray()
+        self._mitigated_count: int = 0
+        self._interventions = _ColumnarLog(
+            [
+                ("bridge_id", "priority", "risk", "action", "assigned_to", "response_steps", "day", "t"),  # _INTERVENTION
+            ]
+        )
+        self._inspections = _ColumnarLog(
+            [
+                ("bridge_id", "day", "t", "due_date", "days_overdue", "risk"),  # _BACKLOG_INSPECTION
+                ("bridge_id", "priority", "risk", "day", "t"),  # _FINDING_INSPECTION
+            ]
+        )
         self._statuses: dict[str, BridgeStatusEntry] = {}
+        # Number of entries satisfying _is_critical_open, kept in sync by the
+        # record_* methods.
+        self._critical_open: int = 0
 
     def reset(self) -> None:
         """Clear all cached bridge metrics and logs."""
 
         self._backlog_history.clear()
+        self._backlog_initial = None
         self._pending_backlog_step.clear()
-        self._response_times.clear()
-        self._mitigated_bridges.clear()
+        self._response_time_sum = 0
+        self._response_time_count = 0
+        self._bridge_index.clear()
+        self._mitigated_bits = bytearray()
+        self._mitigated_count = 0
         self._interventions.clear()
         self._inspections.clear()
         self._statuses.clear()
+        self._critical_open = 0
+
+    def _track(self, bridge_id: str, status: BridgeStatusEntry) -> None:
+        self._statuses[bridge_id] = status
+        self._bridge_index[bridge_id] = len(self._bridge_index)
+
+    def _mark_mitigated(self, bridge_id: str) -> None:
+        index = self._bridge_index[bridge_id]
+        byte, mask = index >> 3, 1 << (index & 7)
+        if byte >= len(self._mitigated_bits):
+            self._mitigated_bits.extend(bytes(byte + 1 - len(self._mitigated_bits)))
+        if not self._mitigated_bits[byte] & mask:
+            self._mitigated_bits[byte] |= mask
+            self._mitigated_count += 1
 
     def record_backlog(
         self,
@@ -104,6 +209,8 @@ class BridgeMaintenanceMonitor:
 
         backlog_list = list(backlog)
         self._backlog_history.append((step, len(backlog_list)))
+        if self._backlog_initial is None:
+            self._backlog_initial = len(backlog_list)
         for entry in backlog_list:
             bridge: BridgeRecord = entry.get("bridge", {})  # type: ignore[assignment]
             bridge_id = _extract_bridge_id(bridge)
@@ -114,21 +221,15 @@ class BridgeMaintenanceMonitor:
             lng, lat = _extract_coords(bridge)
 
             self._inspections.append(
-                {
-                    "bridge_id": bridge_id,
-                    "day": day,
-                    "t": t,
-                    "due_date": due_date,
-                    "days_overdue": days_overdue,
-                    "risk": risk_level,
-                }
+                _BACKLOG_INSPECTION, bridge_id, day, t, due_date, days_overdue, risk_level
             )
 
             self._pending_backlog_step[bridge_id] = step
             priority = "critical" if days_overdue is not None and days_overdue > 0 else "scheduled"
-            status = self._statuses.get(
-                bridge_id,
-                BridgeStatusEntry(
+            status = self._statuses.get(bridge_id)
+            was_critical_open = status is not None and _is_critical_open(status)
+            if status is None:
+                status = BridgeStatusEntry(
                     bridge_id=bridge_id,
                     name=name if isinstance(name, str) else None,
                     priority=priority,
@@ -141,8 +242,8 @@ class BridgeMaintenanceMonitor:
                     lng=lng,
                     lat=lat,
                     last_update={},
-                ),
-            )
+                )
+                self._track(bridge_id, status)
 
             status.priority = priority
             status.risk = risk_level or status.risk
@@ -152,7 +253,7 @@ class BridgeMaintenanceMonitor:
             status.lng = status.lng or lng
             status.lat = status.lat or lat
             status.last_update = {"day": day, "t": t, "step": step}
-            self._statuses[bridge_id] = status
+            self._critical_open += _is_critical_open(status) - was_critical_open
 
     def record_inspection_findings(
         self,
@@ -172,23 +273,16 @@ class BridgeMaintenanceMonitor:
             name = bridge.get("name") or bridge.get("bridge_name")
             lng, lat = _extract_coords(bridge)
 
-            self._inspections.append(
-                {
-                    "bridge_id": bridge_id,
-                    "priority": priority,
-                    "risk": risk_level,
-                    "day": day,
-                    "t": t,
-                }
-            )
+            self._inspections.append(_FINDING_INSPECTION, bridge_id, priority, risk_level, day, t)
 
-            status = self._statuses.get(
-                bridge_id,
-                BridgeStatusEntry(
+            status = self._statuses.get(bridge_id)
+            was_critical_open = status is not None and _is_critical_open(status)
+            if status is None:
+                status = BridgeStatusEntry(
                     bridge_id=bridge_id,
                     name=name if isinstance(name, str) else None,
-                    priority=str(priority) if priority else None,
-                    risk=str(risk_level) if risk_level else None,
+                    priority=_label(priority),
+                    risk=_label(risk_level),
                     status="triaged",
                     work_order_status=None,
                     action=None,
@@ -197,16 +291,16 @@ class BridgeMaintenanceMonitor:
                     lng=lng,
                     lat=lat,
                     last_update={},
-                ),
-            )
+                )
+                self._track(bridge_id, status)
 
-            status.priority = str(priority) if priority else status.priority
-            status.risk = str(risk_level) if risk_level else status.risk
+            status.priority = _label(priority) or status.priority
+            status.risk = _label(risk_level) or status.risk
             status.status = "triaged"
             status.lng = status.lng or lng
             status.lat = status.lat or lat
             status.last_update = {"day": day, "t": t, "step": step}
-            self._statuses[bridge_id] = status
+            self._critical_open += _is_critical_open(status) - was_critical_open
 
     def record_intervention(
         self,
@@ -225,7 +319,8 @@ class BridgeMaintenanceMonitor:
         response_time = None
         if bridge_id in self._pending_backlog_step:
             response_time = max(0, step - self._pending_backlog_step[bridge_id])
-            self._response_times.append(response_time)
+            self._response_time_sum += response_time
+            self._response_time_count += 1
             del self._pending_backlog_step[bridge_id]
 
         lng, lat = _extract_coords(bridge)
@@ -234,25 +329,17 @@ class BridgeMaintenanceMonitor:
         due_date = _serialize_date(bridge.get("next_inspection_due") or bridge.get("next_inspection_date"))
 
         self._interventions.append(
-            {
-                "bridge_id": bridge_id,
-                "priority": priority,
-                "risk": risk_level,
-                "action": action,
-                "assigned_to": assigned_to,
-                "response_steps": response_time,
-                "day": day,
-                "t": t,
-            }
+            _INTERVENTION, bridge_id, priority, risk_level, action, assigned_to, response_time, day, t
         )
 
-        status = self._statuses.get(
-            bridge_id,
-            BridgeStatusEntry(
+        status = self._statuses.get(bridge_id)
+        was_critical_open = status is not None and _is_critical_open(status)
+        if status is None:
+            status = BridgeStatusEntry(
                 bridge_id=bridge_id,
                 name=name if isinstance(name, str) else None,
-                priority=str(priority) if priority else None,
-                risk=str(risk_level) if risk_level else None,
+                priority=_label(priority),
+                risk=_label(risk_level),
                 status="work_order",
                 work_order_status="dispatched",
                 action=action,
@@ -261,11 +348,11 @@ class BridgeMaintenanceMonitor:
                 lng=lng,
                 lat=lat,
                 last_update={},
-            ),
-        )
+            )
+            self._track(bridge_id, status)
 
-        status.priority = str(priority) if priority else status.priority
-        status.risk = str(risk_level) if risk_level else status.risk
+        status.priority = _label(priority) or status.priority
+        status.risk = _label(risk_level) or status.risk
         status.status = "work_order"
         status.work_order_status = "dispatched"
         status.action = action or status.action
@@ -273,7 +360,7 @@ class BridgeMaintenanceMonitor:
         status.lat = status.lat or lat
         status.due_date = status.due_date or due_date
         status.last_update = {"day": day, "t": t, "step": step}
-        self._statuses[bridge_id] = status
+        self._critical_open += _is_critical_open(status) - was_critical_open
 
     def record_work_order_status(
         self,
@@ -292,13 +379,14 @@ class BridgeMaintenanceMonitor:
         lng, lat = _extract_coords(bridge)
         name = bridge.get("name") or bridge.get("bridge_name")
 
-        status = self._statuses.get(
-            bridge_id,
-            BridgeStatusEntry(
+        status = self._statuses.get(bridge_id)
+        was_critical_open = status is not None and _is_critical_open(status)
+        if status is None:
+            status = BridgeStatusEntry(
                 bridge_id=bridge_id,
                 name=name if isinstance(name, str) else None,
-                priority=str(priority) if priority else None,
-                risk=str(task.get("risk")) if task.get("risk") else None,
+                priority=_label(priority),
+                risk=_label(task.get("risk")),
                 status="work_order",
                 work_order_status="in_progress",
                 action=action,
@@ -307,51 +395,49 @@ class BridgeMaintenanceMonitor:
                 lng=lng,
                 lat=lat,
                 last_update={},
-            ),
-        )
+            )
+            self._track(bridge_id, status)
 
         status.status = "work_order"
         status.work_order_status = "in_progress"
         status.action = action or status.action
-        status.priority = str(priority) if priority else status.priority
+        status.priority = _label(priority) or status.priority
         status.lng = status.lng or lng
         status.lat = status.lat or lat
         status.last_update = {"day": day, "t": t, "step": step}
-        self._statuses[bridge_id] = status
+        self._critical_open += _is_critical_open(status) - was_critical_open
 
-        if str(priority).lower() == "critical" and bridge_id not in self._mitigated_bridges:
-            self._mitigated_bridges.add(bridge_id)
+        if str(priority).lower() == "critical":
+            self._mark_mitigated(bridge_id)
 
     def get_metric_tuples(self, current_step: int) -> list[tuple[str, float, int]]:
         """Return metrics ready for storage."""
 
         metrics: list[tuple[str, float, int]] = []
-        if self._backlog_history:
-            metrics.append(("bridge/current_backlog", float(self._backlog_history[-1][1]), current_step))
-            initial = self._backlog_history[0][1]
-            reduction = initial - self._backlog_history[-1][1]
+        if self._backlog_history and self._backlog_initial is not None:
+            current = self._backlog_history[-1][1]
+            metrics.append(("bridge/current_backlog", float(current), current_step))
+            reduction = self._backlog_initial - current
             metrics.append(("bridge/backlog_reduction", float(reduction), current_step))
 
-        if self._response_times:
-            metrics.append(("bridge/avg_response_steps", float(mean(self._response_times)), current_step))
+        if self._response_time_count:
+            avg_response = self._response_time_sum / self._response_time_count
+            metrics.append(("bridge/avg_response_steps", float(avg_response), current_step))
 
-        critical_open = sum(
-            1
-            for status in self._statuses.values()
-            if (status.priority or "").lower() == "critical"
-            and status.status in {"inspection_due", "triaged", "work_order"}
-        )
-        metrics.append(("bridge/critical_open_work_orders", float(critical_open), current_step))
-        metrics.append(("bridge/risk_mitigated", float(len(self._mitigated_bridges)), current_step))
+        metrics.append(("bridge/critical_open_work_orders", float(self._critical_open), current_step))
+        metrics.append(("bridge/risk_mitigated", float(self._mitigated_count), current_step))
         return metrics
 
     def export_state(self) -> dict[str, Any]:
         """Provide JSON-serializable state for artifacts and visualization."""
 
         return {
-            "inspections": self._inspections,
-            "interventions": self._interventions,
-            "work_orders": [status.__dict__ for status in self._statuses.values()],
+            "inspections": self._inspections.to_rows(),
+            "interventions": self._interventions.to_rows(),
+            "work_orders": [
+                {slot: getattr(status, slot) for slot in BridgeStatusEntry.__slots__}
+                for status in self._statuses.values()
+            ],
         }
 
 
@@ -103,6 +103,16 @@ class Messager:
         """
         self._pending_messages.append(message)
 
+    @lock_decorator
+    async def send_messages(self, messages: list[Message]):
+        """
+        Send a batch of messages under a single lock acquisition.
+
+        - **Args**:
+            - `messages` (list[Message]): Messages to send.
+        """
+        self._pending_messages.extend(messages)
+
     @lock_decorator
     async def fetch_pending_messages(self):
         """
@@ -1,16 +1,28 @@
 """Tools package for AgentSociety domain adapters."""
 from .bridge_tools import (
+    BridgeColumns,
     BridgeRecord,
+    build_bridge_columns,
+    canonicalize_bridge_records,
     filter_bridges_by_condition,
+    find_latest_bridge_file,
     load_clean_bridge_records,
     propose_repair_actions,
+    propose_repair_actions_from_scored,
+    read_bridge_records,
     schedule_overdue_inspections,
 )
 
 __all__ = [
+    "BridgeColumns",
     "BridgeRecord",
+    "build_bridge_columns",
+    "canonicalize_bridge_records",
     "filter_bridges_by_condition",
+    "find_latest_bridge_file",
     "load_clean_bridge_records",
     "propose_repair_actions",
+    "propose_repair_actions_from_scored",
+    "read_bridge_records",
     "schedule_overdue_inspections",
 ]
@@ -2,13 +2,45 @@ from __future__ import annotations
 
 from datetime import date, datetime
 from pathlib import Path
-from typing import Iterable, MutableMapping, Sequence
+from typing import Iterable, Mapping, MutableMapping, NamedTuple, Sequence
 import csv
+import functools
+import heapq
 import json
+import operator
+import os
+
+import numpy as np
+
+try:
+    import polars as pl
+except ImportError:  # polars is optional; fall back to the stdlib csv reader
+    pl = None
+
+try:
+    from orjson import loads as _json_loads
+except ImportError:  # orjson is optional; the stdlib parser also accepts bytes
+    _json_loads = json.loads
 
 
 BridgeRecord = MutableMapping[str, object]
 
+# Ordinal stored in ``BridgeColumns.due_ordinals`` when a record has no usable
+# inspection date; ``date.toordinal`` never returns 0.
+MISSING_DUE_ORDINAL = 0
+RISK_CODES = {"low": 1, "medium": 2, "high": 3, "critical": 4}
+
+
+class BridgeColumns(NamedTuple):
+    """Column-oriented view of a record list used by vectorized filters."""
+
+    condition_scores: np.ndarray
+    """float64 condition scores, NaN when missing or unparseable"""
+    due_ordinals: np.ndarray
+    """int32 ``date.toordinal`` of the next due date, or ``MISSING_DUE_ORDINAL``"""
+    risk_codes: np.ndarray
+    """uint8 codes from ``RISK_CODES``; 0 for unknown labels"""
+
 
 def _parse_date(value: object) -> date | None:
     if value is None:
@@ -23,12 +55,131 @@ def _parse_date(value: object) -> date | None:
         except (OverflowError, OSError, ValueError):
             return None
     if isinstance(value, str):
-        for fmt in ("%Y-%m-%d", "%m/%d/%Y", "%Y/%m/%d", "%Y%m%d"):
+        return _parse_date_str(value)
+    return None
+
+
+_DATE_FORMATS = ("%Y-%m-%d", "%m/%d/%Y", "%Y/%m/%d", "%Y%m%d")
+
+
+def _guess_date_format(value: str) -> str | None:
+    """Pick the only format in ``_DATE_FORMATS`` that fits the string's shape."""
+    if "-" in value:
+        return "%Y-%m-%d"
+    if "/" in value:
+        return "%Y/%m/%d" if value[4:5] == "/" else "%m/%d/%Y"
+    return None
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_date_str(value: str) -> date | None:
+    # Inspection dates repeat heavily across bridges, so cache by string.
+    if len(value) == 8 and value.isdigit():
+        try:
+            return date(int(value[:4]), int(value[4:6]), int(value[6:]))
+        except ValueError:
+            return None
+    if len(value) == 10 and value[4] == "-" and value[7] == "-":
+        # ``fromisoformat`` is C code; the shape check keeps it from accepting
+        # ISO forms (e.g. week dates) that the formats below reject.
+        try:
+            return date.fromisoformat(value)
+        except ValueError:
+            pass
+    guess = _guess_date_format(value)
+    if guess is not None:
+        try:
+            return datetime.strptime(value, guess).date()
+        except ValueError:
+            pass
+    for fmt in _DATE_FORMATS:
+        if fmt == guess:
+            continue
+        try:
+            return datetime.strptime(value, fmt).date()
+        except ValueError:
+            continue
+    return None
+
+
+def _latest_bridge_file(
+    directory: str | Path = "data/bridge_inventory/processed",
+) -> tuple[float, Path] | None:
+    """Return ``(mtime, path)`` of the newest JSON or CSV file in ``directory``.
+
+    Schema summaries written next to the cleaned data by the ingestion script
+    (``*_schema_*.json``) are not inventories and are skipped. One directory
+    pass; ``DirEntry.stat`` reuses the scandir result where the
+    platform provides it, and the mtime is handed back so callers need not
+    stat the winner again. Ties on mtime keep the old glob order: JSON before
+    CSV, then by name.
+    """
+
+    best: os.DirEntry[str] | None = None
+    best_key: tuple[float, bool, str] = (float("-inf"), True, "")
+    try:
+        entries = os.scandir(directory)
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+    with entries:
+        for entry in entries:
+            suffix = os.path.splitext(entry.name)[1].lower()
+            if suffix not in (".json", ".csv") or not entry.is_file():
+                continue
+            if suffix == ".json" and "_schema_" in entry.name:
+                continue
             try:
-                return datetime.strptime(value, fmt).date()
-            except ValueError:
+                mtime = entry.stat().st_mtime
+            except FileNotFoundError:  # removed since the directory was listed
                 continue
-    return None
+            is_csv = suffix == ".csv"
+            if mtime > best_key[0] or (
+                best is not None and mtime == best_key[0] and (is_csv, entry.name) < best_key[1:]
+            ):
+                best, best_key = entry, (mtime, is_csv, entry.name)
+    return (best_key[0], Path(best.path)) if best is not None else None
+
+
+def find_latest_bridge_file(directory: str | Path = "data/bridge_inventory/processed") -> Path | None:
+    """Return the newest JSON or CSV file in ``directory``, or ``None``."""
+
+    latest = _latest_bridge_file(directory)
+    return latest[1] if latest is not None else None
+
+
+def _read_csv_rows(file_path: Path) -> list[BridgeRecord]:
+    with file_path.open(newline="", encoding="utf-8") as handle:
+        # Rows of bare delimiters carry no data either; skip them so the
+        # polars and csv readers agree.
+        return [dict(row) for row in csv.DictReader(handle) if any(row.values())]
+
+
+def read_bridge_records(file_path: Path) -> list[BridgeRecord]:
+    """Parse a single cleaned CSV or JSON file, returning ``[]`` on failure."""
+
+    try:
+        if file_path.suffix.lower() == ".json":
+            payload = _json_loads(file_path.read_bytes())
+            if not isinstance(payload, list):
+                return []
+            records = [row for row in payload if isinstance(row, MutableMapping)]
+        elif pl is not None:
+            try:
+                # Read every column as text (no inference) and blank out nulls
+                # so rows match what csv.DictReader would produce. polars turns
+                # blank lines into all-empty rows, which DictReader skips; drop
+                # them.
+                frame = pl.read_csv(file_path, infer_schema_length=0).fill_null("")
+                records = frame.filter(pl.any_horizontal(pl.all() != "")).to_dicts()
+            except pl.exceptions.PolarsError:
+                # Ragged lines and other malformed input that DictReader
+                # tolerates.
+                records = _read_csv_rows(file_path)
+        else:
+            records = _read_csv_rows(file_path)
+        return canonicalize_bridge_records(records)
+    except Exception:
+        return []
 
 
 def load_clean_bridge_records(directory: str | Path = "data/bridge_inventory/processed") -> list[BridgeRecord]:
@@ -39,32 +190,126 @@ def load_clean_bridge_records(directory: str | Path = "data/bridge_inventory/pro
     parsing fails, it returns an empty list instead of raising.
     """
 
-    base_path = Path(directory)
-    if not base_path.exists():
+    file_path = find_latest_bridge_file(directory)
+    if file_path is None:
         return []
+    return read_bridge_records(file_path)
+
+
+def _first_value(record: BridgeRecord, *keys: str) -> object | None:
+    """Return the first value under ``keys`` that is neither ``None`` nor ``""``.
+
+    Unlike chaining ``record.get(a) or record.get(b)``, falsy values such as a
+    ``0`` condition rating are kept.
+    """
+
+    for key in keys:
+        value = record.get(key)
+        if value is not None and value != "":
+            return value
+    return None
 
-    candidate_files: list[Path] = []
-    candidate_files.extend(sorted(base_path.glob("*.json")))
-    candidate_files.extend(sorted(base_path.glob("*.csv")))
-    if not candidate_files:
-        return []
 
-    file_path = max(candidate_files, key=lambda p: p.stat().st_mtime)
+# Canonical field name -> legacy aliases, in lookup order.
+_FIELD_ALIASES: tuple[tuple[str, tuple[str, ...]], ...] = (
+    ("condition_rating", ("condition",)),
+    ("risk_level", ("risk",)),
+    ("next_inspection_due", ("next_inspection_date",)),
+)
+
+
+def canonicalize_bridge_records(records: list[BridgeRecord]) -> list[BridgeRecord]:
+    """Fill empty canonical fields from their aliases, in place.
+
+    After this pass, alias lookups in the helpers below resolve on their first
+    key. Records that already carry a canonical value are left untouched.
+    """
+
+    for record in records:
+        for canonical, aliases in _FIELD_ALIASES:
+            value = record.get(canonical)
+            if value is None or value == "":
+                alias_value = _first_value(record, *aliases)
+                if alias_value is not None:
+                    record[canonical] = alias_value
+    return records
+
+
+def _condition_score(record: BridgeRecord) -> float | None:
+    condition_raw = _first_value(record, "condition_rating", "condition")
     try:
-        if file_path.suffix.lower() == ".json":
-            return json.loads(file_path.read_text())  # type: ignore[arg-type]
-        records: list[BridgeRecord] = []
-        with file_path.open(newline="", encoding="utf-8") as handle:
-            reader = csv.DictReader(handle)
-            for row in reader:
-                records.append(dict(row))
-        return records
-    except Exception:
-        return []
+        score = float(condition_raw) if condition_raw is not None else None  # type: ignore[arg-type]
+    except (TypeError, ValueError):
+        return None
+    if score != score:  # NaN is as unusable as a missing rating
+        return None
+    return score
+
+
+def build_bridge_columns(records: Sequence[BridgeRecord]) -> BridgeColumns:
+    """Extract condition, due-date, and risk columns from ``records``.
+
+    Field aliases and date parsing follow :func:`filter_bridges_by_condition`
+    and :func:`schedule_overdue_inspections`, so masks computed on the columns
+    select the same rows as those helpers. Entries that are not mappings get
+    missing values (NaN score), so condition masks never select them.
+    """
+
+    count = len(records)
+    condition_scores = np.full(count, np.nan, dtype=np.float64)
+    due_ordinals = np.full(count, MISSING_DUE_ORDINAL, dtype=np.int32)
+    risk_codes = np.zeros(count, dtype=np.uint8)
+    for idx, record in enumerate(records):
+        if not isinstance(record, Mapping):
+            continue
+        score = _condition_score(record)
+        if score is not None:
+            condition_scores[idx] = score
+        due_raw = _first_value(record, "next_inspection_due", "next_inspection_date")
+        due_date = _parse_date(due_raw) or _parse_date(record.get("last_inspection_date"))
+        if due_date is not None:
+            due_ordinals[idx] = due_date.toordinal()
+        risk_raw = _first_value(record, "risk_level", "risk")
+        if risk_raw is not None:
+            risk_codes[idx] = RISK_CODES.get(str(risk_raw).lower(), 0)
+    return BridgeColumns(condition_scores, due_ordinals, risk_codes)
+
+
+def _first_present(df: "pl.DataFrame", names: Sequence[str]) -> "pl.Expr":
+    # Text value of the first alias column that is non-null and non-empty.
+    candidates = []
+    for name in names:
+        if name in df.columns:
+            text = pl.col(name).cast(pl.Utf8, strict=False)
+            candidates.append(pl.when(text != "").then(text))
+    if not candidates:
+        return pl.lit(None, dtype=pl.Utf8)
+    return pl.coalesce(candidates)
+
+
+def filter_bridges_by_condition_df(
+    df: "pl.DataFrame",
+    max_condition_score: int | float = 4,
+    risk_levels: Sequence[str] | None = None,
+) -> "pl.DataFrame":
+    """Polars counterpart of :func:`filter_bridges_by_condition`.
+
+    The filter is expressed as column expressions, so rows stay columnar until
+    the caller materializes them.
+    """
+
+    if pl is None:
+        raise ImportError("polars is required for filter_bridges_by_condition_df")
+    condition = _first_present(df, ("condition_rating", "condition")).cast(pl.Float64, strict=False)
+    mask = condition.is_not_null() & condition.is_not_nan() & (condition <= float(max_condition_score))
+    if risk_levels:
+        risk = _first_present(df, ("risk_level", "risk")).str.to_lowercase()
+        mask = mask & risk.is_in([level.lower() for level in risk_levels])
+    return df.filter(mask)
 
 
 def filter_bridges_by_condition(
-    records: Iterable[BridgeRecord],
+    records: Iterable[BridgeRecord] | "pl.DataFrame",
     max_condition_score: int | float = 4,
     risk_levels: Sequence[str] | None = None,
 ) -> list[BridgeRecord]:
@@ -73,27 +318,37 @@ def filter_bridges_by_condition(
     Condition ratings in the National Bridge Inventory typically use a 0-9
     scale; lower scores indicate worse conditions. This helper keeps bridges
     that are at or below ``max_condition_score`` and optionally match a set of
-    risk level labels (e.g., HIGH, MEDIUM).
+    risk level labels (e.g., HIGH, MEDIUM). A polars ``DataFrame`` input is
+    filtered with :func:`filter_bridges_by_condition_df` and converted to
+    dictionaries only at the end.
     """
 
-    normalized_risks = {level.lower() for level in (risk_levels or [])}
+    if pl is not None and isinstance(records, pl.DataFrame):
+        return filter_bridges_by_condition_df(records, max_condition_score, risk_levels).to_dicts()
+
+    max_score = float(max_condition_score)
+    normalized_risks = frozenset(level.lower() for level in (risk_levels or ()))
     filtered: list[BridgeRecord] = []
     for record in records:
-        condition_raw = record.get("condition_rating") or record.get("condition")
+        # Alias lookups inline _first_value: empty strings fall through, 0 does not.
+        condition_raw = record.get("condition_rating")
+        if condition_raw is None or condition_raw == "":
+            condition_raw = record.get("condition")
+        if condition_raw is None:
+            continue
         try:
-            condition_score = float(condition_raw) if condition_raw is not None else None
+            condition_score = float(condition_raw)
         except (TypeError, ValueError):
-            condition_score = None
-
-        risk_raw = record.get("risk_level") or record.get("risk")
-        risk_label = str(risk_raw).lower() if risk_raw is not None else None
-
-        if condition_score is None:
             continue
-        if condition_score > float(max_condition_score):
-            continue
-        if normalized_risks and risk_label not in normalized_risks:
+        # NaN compares False, so it is dropped like a missing rating.
+        if not condition_score <= max_score:
             continue
+        if normalized_risks:
+            risk_raw = record.get("risk_level")
+            if risk_raw is None or risk_raw == "":
+                risk_raw = record.get("risk")
+            if risk_raw is None or risk_raw == "" or str(risk_raw).lower() not in normalized_risks:
+                continue
         filtered.append(record)
     return filtered
 
@@ -102,19 +357,21 @@ def schedule_overdue_inspections(
     records: Iterable[BridgeRecord],
     reference_date: date | None = None,
     lead_time_days: int = 30,
+    top_k: int | None = None,
 ) -> list[dict[str, object]]:
     """Identify bridges with overdue or soon-due inspections.
 
     The scheduler checks ``next_inspection_due`` or ``last_inspection_date``
     fields, treating missing values as overdue. Bridges are sorted by urgency
-    (oldest due date first) and annotated with ``due_date`` and
-    ``days_overdue`` keys.
+    (oldest due date first) and annotated with ``due_date``, ``days_overdue``
+    and ``priority_label`` (``"overdue"`` or ``"soon"``) keys. When ``top_k``
+    is given only the first ``top_k`` entries of that ordering are returned.
     """
 
     today = reference_date or date.today()
     backlog: list[dict[str, object]] = []
     for record in records:
-        due_raw = record.get("next_inspection_due") or record.get("next_inspection_date")
+        due_raw = _first_value(record, "next_inspection_due", "next_inspection_date")
         last_raw = record.get("last_inspection_date")
         due_date = _parse_date(due_raw) or _parse_date(last_raw)
         if due_date is None:
@@ -125,11 +382,43 @@ def schedule_overdue_inspections(
                 "bridge": record,
                 "due_date": due_date,
                 "days_overdue": days_overdue,
+                "priority_label": "overdue" if days_overdue > 0 else "soon",
             })
-    backlog.sort(key=lambda entry: (entry["days_overdue"], entry["due_date"]))
+    # ``due_date`` is fixed by ``days_overdue`` for a given ``today``, so the
+    # single int key orders exactly like the former (days, due_date) tuple.
+    by_days = operator.itemgetter("days_overdue")
+    if top_k is not None:
+        return heapq.nsmallest(top_k, backlog, key=by_days)
+    backlog.sort(key=by_days)
     return backlog
 
 
+_CRITICAL_ACTION = "Stabilize, post warning signage, and initiate emergency repair crew dispatch"
+_ROUTINE_ACTION = "Schedule preventive maintenance and patch identified defects"
+
+
+def propose_repair_actions_from_scored(
+    scored: Iterable[tuple[BridgeRecord, float]],
+    severe_threshold: int | float = 3,
+) -> list[dict[str, object]]:
+    """Like :func:`propose_repair_actions` for ``(record, condition_score)`` pairs.
+
+    Use this when the scores are already known (e.g. from
+    :func:`build_bridge_columns`) to skip parsing them again.
+    """
+
+    proposals: list[dict[str, object]] = []
+    for record, condition_score in scored:
+        critical = condition_score <= severe_threshold
+        proposals.append({
+            "bridge": record,
+            "priority": "critical" if critical else "routine",
+            "risk": _first_value(record, "risk_level", "risk") or "unknown",
+            "recommended_action": _CRITICAL_ACTION if critical else _ROUTINE_ACTION,
+        })
+    return proposals
+
+
 def propose_repair_actions(
     records: Iterable[BridgeRecord],
     severe_threshold: int | float = 3,
@@ -137,36 +426,51 @@ def propose_repair_actions(
     """Generate repair proposals based on condition severity.
 
     Each returned proposal contains the bridge record, a priority label, and a
-    recommended action string.
+    recommended action string. Records without a usable condition score are
+    skipped.
     """
 
     proposals: list[dict[str, object]] = []
     for record in records:
-        condition_raw = record.get("condition_rating") or record.get("condition")
+        # Same alias and NaN handling as _condition_score, inlined.
+        condition_raw = record.get("condition_rating")
+        if condition_raw is None or condition_raw == "":
+            condition_raw = record.get("condition")
+        if condition_raw is None:
+            continue
         try:
-            condition_score = float(condition_raw) if condition_raw is not None else None
+            condition_score = float(condition_raw)
         except (TypeError, ValueError):
-            condition_score = None
-        if condition_score is None:
+            continue
+        if condition_score != condition_score:
             continue
 
-        priority = "critical" if condition_score <= severe_threshold else "routine"
-        risk_context = record.get("risk_level") or record.get("risk") or "unknown"
-        action = "Stabilize, post warning signage, and initiate emergency repair crew dispatch" if priority == "critical" else "Schedule preventive maintenance and patch identified defects"
-
+        critical = condition_score <= severe_threshold
+        risk_raw = record.get("risk_level")
+        if risk_raw is None or risk_raw == "":
+            risk_raw = record.get("risk")
         proposals.append({
             "bridge": record,
-            "priority": priority,
-            "risk": risk_context,
-            "recommended_action": action,
+            "priority": "critical" if critical else "routine",
+            "risk": risk_raw or "unknown",
+            "recommended_action": _CRITICAL_ACTION if critical else _ROUTINE_ACTION,
         })
     return proposals
 
 
 __all__ = [
+    "BridgeColumns",
     "BridgeRecord",
+    "MISSING_DUE_ORDINAL",
+    "RISK_CODES",
+    "build_bridge_columns",
+    "canonicalize_bridge_records",
     "filter_bridges_by_condition",
+    "filter_bridges_by_condition_df",
+    "find_latest_bridge_file",
     "load_clean_bridge_records",
     "propose_repair_actions",
+    "propose_repair_actions_from_scored",
+    "read_bridge_records",
     "schedule_overdue_inspections",
 ]
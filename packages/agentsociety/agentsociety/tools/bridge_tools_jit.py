@@ -0,0 +1,73 @@
+"""Compiled kernels for bridge inventory prioritization.
+
+``numba`` is optional: when it is not installed, :func:`prioritize` falls back
+to an equivalent vectorized numpy implementation.
+"""
+from __future__ import annotations
+
+import math
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # pragma: no cover - exercised only without numba
+    njit = None
+
+__all__ = ["prioritize"]
+
+
+def _prioritize_loop(days_overdue, condition_scores, risk_codes):
+    n = days_overdue.shape[0]
+    keys = np.empty(n, dtype=np.int64)
+    for i in range(n):
+        # Floor (not int() truncation) to match the numpy fallback for
+        # negative fractional scores.
+        severity = 9 - int(math.floor(condition_scores[i]))
+        if severity < 0:
+            severity = 0
+        elif severity > 255:
+            severity = 255
+        keys[i] = (
+            (np.int64(days_overdue[i]) << 16)
+            | np.int64((255 - severity) << 8)
+            | np.int64(255 - risk_codes[i])
+        )
+    return np.argsort(keys, kind="mergesort")
+
+
+def _prioritize_numpy(days_overdue, condition_scores, risk_codes):
+    severity = np.clip(9 - np.floor(condition_scores), 0, 255).astype(np.int64)
+    keys = (
+        (days_overdue.astype(np.int64) << 16)
+        | ((255 - severity) << 8)
+        | (255 - risk_codes.astype(np.int64))
+    )
+    return np.argsort(keys, kind="stable")
+
+
+if njit is not None:
+    # ``cache=True`` persists the compiled kernel so only the first process
+    # pays the compile cost.
+    _prioritize = njit(cache=True, boundscheck=False)(_prioritize_loop)
+else:
+    _prioritize = _prioritize_numpy
+
+
+def prioritize(
+    days_overdue: np.ndarray,
+    condition_scores: np.ndarray,
+    risk_codes: np.ndarray,
+) -> np.ndarray:
+    """Return indices ordering bridges for inspection.
+
+    Bridges are ordered by ascending ``days_overdue``; ties are broken by worse
+    condition (lower score on the 0-9 NBI scale) and then by higher risk code.
+    ``condition_scores`` must be finite for every row.
+    """
+
+    return _prioritize(
+        np.ascontiguousarray(days_overdue, dtype=np.int64),
+        np.ascontiguousarray(condition_scores, dtype=np.float64),
+        np.ascontiguousarray(risk_codes, dtype=np.uint8),
+    )
@@ -9,16 +9,27 @@ JSON schema summary for downstream processing.
 from __future__ import annotations
 
 import argparse
+import concurrent.futures
+import contextlib
 import csv
 import datetime as dt
+import functools
 import importlib
+import itertools
 import json
 import logging
+import operator
+from collections import deque
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, MutableMapping, Optional
+from typing import IO, Any, Callable, Dict, Iterable, Iterator, List, MutableMapping, Optional, Tuple
 
 import requests
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+    orjson = None
+
 DEFAULT_SERVICE_URL = (
     "https://services.arcgis.com/VTyQ9soqVUKDOhoj/ArcGIS/rest/services/"
     "Bridge_Inventory/FeatureServer/0"
@@ -58,6 +69,11 @@ FIELD_PRIORITIES = {
         "inspection",
     ],
 }
+# Immutable copies of FIELD_PRIORITIES used on the per-feature hot path.
+_FIELD_KEYS = {column: tuple(keys) for column, keys in FIELD_PRIORITIES.items()}
+
+
+DATE_FORMATS = ("%Y-%m-%d", "%Y/%m/%d", "%m/%d/%Y", "%Y%m%d")
 
 
 class FeatureServiceError(RuntimeError):
@@ -68,8 +84,26 @@ class SchemaSummary(Dict[str, Any]):
     """Convenience type for schema summaries."""
 
 
+def _dumps(obj: Any, indent: bool = False) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(obj, indent=2 if indent else None).encode("utf-8")
+
+
 def _timestamp_tag() -> str:
-    return dt.datetime.utcnow().strftime("%Y%m%dT%H%M%SZ")
+    return dt.datetime.now(dt.timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+
+
+_ARTIFACT_NAMES = {
+    "geojson": "{prefix}_{stamp}.geojson",
+    "parquet": "{prefix}_{stamp}.parquet",
+    "csv": "{prefix}_clean_{stamp}.csv",
+    "schema": "{prefix}_schema_{stamp}.json",
+}
+
+
+def _artifact_path(directory: Path, prefix: str, kind: str, stamp: str) -> Path:
+    return directory / _ARTIFACT_NAMES[kind].format(prefix=prefix, stamp=stamp)
 
 
 def _coerce_date(value: Any) -> Optional[str]:
@@ -84,7 +118,42 @@ def _coerce_date(value: Any) -> Optional[str]:
     text = str(value).strip()
     if not text:
         return None
-    for fmt in ("%Y-%m-%d", "%Y/%m/%d", "%m/%d/%Y", "%Y%m%d"):
+    return _coerce_date_text(text)
+
+
+def _guess_date_format(text: str) -> Optional[str]:
+    if "-" in text:
+        return "%Y-%m-%d"
+    if "/" in text:
+        return "%Y/%m/%d" if text[4:5] == "/" else "%m/%d/%Y"
+    return None
+
+
+@functools.lru_cache(maxsize=4096)
+def _coerce_date_text(text: str) -> Optional[str]:
+    if len(text) == 8 and text.isdigit():
+        try:
+            return dt.date(int(text[:4]), int(text[4:6]), int(text[6:])).isoformat()
+        except ValueError:
+            return None
+    if len(text) == 10 and text[4] == "-" and text[7] == "-":
+        # ``fromisoformat`` is C code; the shape check keeps it from accepting
+        # ISO forms (e.g. week dates) that DATE_FORMATS rejects.
+        try:
+            return dt.date.fromisoformat(text).isoformat()
+        except ValueError:
+            pass
+    # Try the format matching the string's shape first so the common case
+    # does not raise and catch ValueError for every non-matching format.
+    guess = _guess_date_format(text)
+    if guess is not None:
+        try:
+            return dt.datetime.strptime(text, guess).date().isoformat()
+        except ValueError:
+            pass
+    for fmt in DATE_FORMATS:
+        if fmt == guess:
+            continue
         try:
             return dt.datetime.strptime(text, fmt).date().isoformat()
         except ValueError:
@@ -104,55 +173,169 @@ def _coerce_float(value: Any) -> Optional[float]:
     return number
 
 
-def _extract_first(attributes: MutableMapping[str, Any], keys: Iterable[str]) -> Any:
+def _compile_picker(column: str, keys: Iterable[str]) -> Callable[[MutableMapping[str, Any]], Any]:
+    """Build a function returning the first value under ``keys`` that is neither
+    ``None`` nor ``""`` (or ``None`` if there is none).
+
+    The keys are unrolled into one ``get`` and test each, so the hot loop pays
+    no iteration overhead. Keys are embedded with ``repr``; the explicit
+    ``None``/``""`` test (rather than an ``or`` chain) keeps falsy values such
+    as a ``0`` rating.
+    """
+
+    lines = [f"def pick_{column}(attributes):"]
     for key in keys:
-        if key in attributes:
-            val = attributes[key]
-            if val not in (None, ""):
-                return val
-    return None
+        lines.append(f"    value = attributes.get({key!r})")
+        lines.append('    if value is not None and value != "":')
+        lines.append("        return value")
+    lines.append("    return None")
+    namespace: Dict[str, Any] = {}
+    exec("\n".join(lines), namespace)
+    return namespace[f"pick_{column}"]
 
 
-def fetch_features(
+_PICKERS = {column: _compile_picker(column, keys) for column, keys in _FIELD_KEYS.items()}
+
+
+def _query(session: requests.Session, service_url: str, params: Dict[str, Any]) -> Dict[str, Any]:
+    response = session.get(f"{service_url}/query", params={"f": "json", "where": "1=1", **params}, timeout=60)
+    response.raise_for_status()
+    return response.json()
+
+
+def _query_page(session: requests.Session, service_url: str, offset: int, count: int) -> Dict[str, Any]:
+    payload = _query(
+        session,
+        service_url,
+        {"outFields": "*", "resultOffset": offset, "resultRecordCount": count, "outSR": 4326},
+    )
+    if payload.get("features") is None:
+        raise FeatureServiceError("Response is missing 'features' key")
+    return payload
+
+
+def _query_count(session: requests.Session, service_url: str) -> Optional[int]:
+    try:
+        count = _query(session, service_url, {"returnCountOnly": "true"}).get("count")
+    except (requests.RequestException, ValueError):
+        return None
+    return count if isinstance(count, int) else None
+
+
+def _fetch_range(session: requests.Session, service_url: str, offset: int, size: int) -> List[Dict[str, Any]]:
+    """Fetch features ``[offset, offset + size)``.
+
+    Services may cap a page below ``size`` (their ``maxRecordCount``); short
+    pages are followed up until the range is filled or the data runs out.
+    """
+
+    features: List[Dict[str, Any]] = []
+    while len(features) < size:
+        payload = _query_page(session, service_url, offset + len(features), size - len(features))
+        page = payload["features"]
+        features.extend(page)
+        if not page or not payload.get("exceededTransferLimit"):
+            break
+    return features[:size]
+
+
+def iter_feature_batches(
     service_url: str,
     batch_size: int = 1000,
     max_features: Optional[int] = None,
-) -> List[Dict[str, Any]]:
-    """Stream all features from the ArcGIS Feature Service."""
-
-    features: List[Dict[str, Any]] = []
+    max_workers: int = 8,
+) -> Iterator[List[Dict[str, Any]]]:
+    """Yield pages of features from the ArcGIS Feature Service in offset order.
+
+    Requests share one keep-alive session. When the service answers a
+    ``returnCountOnly`` query, up to ``max_workers`` pages are fetched
+    concurrently, with at most that many pages in flight, so memory stays
+    bounded. Otherwise pages are fetched one after another until the service
+    stops reporting ``exceededTransferLimit``.
+    """
+
+    with requests.Session() as session:
+        adapter = requests.adapters.HTTPAdapter(pool_maxsize=max(max_workers, 1))
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+
+        total = _query_count(session, service_url) if max_workers > 1 else None
+        if total is None:
+            yield from _iter_serial_batches(session, service_url, batch_size, max_features)
+            return
+
+        if max_features is not None:
+            total = min(total, max_features)
+        offsets = iter(range(0, total, batch_size))
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as pool:
+            pending = deque(
+                pool.submit(_fetch_range, session, service_url, offset, min(batch_size, total - offset))
+                for offset in itertools.islice(offsets, max_workers)
+            )
+            while pending:
+                batch = pending.popleft().result()
+                for offset in itertools.islice(offsets, 1):
+                    pending.append(
+                        pool.submit(_fetch_range, session, service_url, offset, min(batch_size, total - offset))
+                    )
+                if batch:
+                    yield batch
+
+
+def _iter_serial_batches(
+    session: requests.Session,
+    service_url: str,
+    batch_size: int,
+    max_features: Optional[int],
+) -> Iterator[List[Dict[str, Any]]]:
+    remaining = max_features
     offset = 0
     while True:
-        params = {
-            "f": "json",
-            "where": "1=1",
-            "outFields": "*",
-            "resultOffset": offset,
-            "resultRecordCount": batch_size,
-            "outSR": 4326,
-        }
-        response = requests.get(f"{service_url}/query", params=params, timeout=60)
-        response.raise_for_status()
-        payload = response.json()
-        batch = payload.get("features")
-        if batch is None:
-            raise FeatureServiceError("Response is missing 'features' key")
-
-        features.extend(batch)
-        if max_features is not None and len(features) >= max_features:
-            return features[:max_features]
-
-        if not payload.get("exceededTransferLimit"):
-            break
+        payload = _query_page(session, service_url, offset, batch_size)
+        batch = payload["features"]
+
+        if remaining is not None:
+            batch = batch[:remaining]
+            remaining -= len(batch)
+        if batch:
+            yield batch
 
-        offset += batch_size
+        # Advance by what the service actually returned, which may be less
+        # than ``batch_size`` when it caps page sizes.
+        returned = len(payload["features"])
+        if remaining == 0 or not returned or not payload.get("exceededTransferLimit"):
+            return
 
-    return features
+        offset += returned
+
+
+def fetch_features(
+    service_url: str,
+    batch_size: int = 1000,
+    max_features: Optional[int] = None,
+    max_workers: int = 8,
+) -> List[Dict[str, Any]]:
+    """Fetch all features from the ArcGIS Feature Service into one list."""
+
+    return [
+        feature
+        for batch in iter_feature_batches(
+            service_url, batch_size=batch_size, max_features=max_features, max_workers=max_workers
+        )
+        for feature in batch
+    ]
 
 
 def normalize_features(features: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
     """Flatten the raw features into tabular rows."""
 
+    pick_structure_id = _PICKERS["structure_id"]
+    pick_state_code = _PICKERS["state_code"]
+    pick_county_code = _PICKERS["county_code"]
+    pick_element_code = _PICKERS["element_code"]
+    pick_condition_rating = _PICKERS["condition_rating"]
+    pick_inspection_date = _PICKERS["inspection_date"]
+
     normalized: List[Dict[str, Any]] = []
     for feature in features:
         attrs: MutableMapping[str, Any] = feature.get("attributes") or {}
@@ -162,16 +345,12 @@ def normalize_features(features: Iterable[Dict[str, Any]]) -> List[Dict[str, Any
         longitude = _coerce_float(geom.get("x") or geom.get("lon"))
 
         row = {
-            "structure_id": _extract_first(attrs, FIELD_PRIORITIES["structure_id"]),
-            "state_code": _extract_first(attrs, FIELD_PRIORITIES["state_code"]),
-            "county_code": _extract_first(attrs, FIELD_PRIORITIES["county_code"]),
-            "element_code": _extract_first(attrs, FIELD_PRIORITIES["element_code"]),
-            "condition_rating": _coerce_float(
-                _extract_first(attrs, FIELD_PRIORITIES["condition_rating"])
-            ),
-            "inspection_date": _coerce_date(
-                _extract_first(attrs, FIELD_PRIORITIES["inspection_date"])
-            ),
+            "structure_id": pick_structure_id(attrs),
+            "state_code": pick_state_code(attrs),
+            "county_code": pick_county_code(attrs),
+            "element_code": pick_element_code(attrs),
+            "condition_rating": _coerce_float(pick_condition_rating(attrs)),
+            "inspection_date": _coerce_date(pick_inspection_date(attrs)),
             "latitude": latitude,
             "longitude": longitude,
         }
@@ -180,13 +359,180 @@ def normalize_features(features: Iterable[Dict[str, Any]]) -> List[Dict[str, Any
     return normalized
 
 
-def write_geojson(features: List[Dict[str, Any]], path: Path) -> Path:
-    content = {"type": "FeatureCollection", "features": features}
-    path.write_text(json.dumps(content, indent=2))
-    return path
+def _load_pyarrow_compute() -> Optional[Tuple[Any, Any, Any]]:
+    for name in ("pyarrow", "pyarrow.compute", "pyarrow.csv"):
+        if importlib.util.find_spec(name) is None:
+            logging.warning("%s not installed; using row-wise normalization", name)
+            return None
+    return (
+        importlib.import_module("pyarrow"),
+        importlib.import_module("pyarrow.compute"),
+        importlib.import_module("pyarrow.csv"),
+    )
 
 
-def write_parquet(records: List[Dict[str, Any]], path: Path) -> Optional[Path]:
+_NUMBER_PATTERN = r"^[-+]?(\d+\.?\d*|\.\d+)([eE][-+]?\d+)?$"
+
+
+def normalized_arrow_schema(pyarrow: Any) -> Any:
+    return pyarrow.schema(
+        [
+            ("structure_id", pyarrow.string()),
+            ("state_code", pyarrow.string()),
+            ("county_code", pyarrow.string()),
+            ("element_code", pyarrow.string()),
+            ("condition_rating", pyarrow.float64()),
+            ("inspection_date", pyarrow.date32()),
+            ("latitude", pyarrow.float64()),
+            ("longitude", pyarrow.float64()),
+        ]
+    )
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _attribute_arrays(pyarrow: Any, attributes: List[MutableMapping[str, Any]], key: str) -> List[Any]:
+    """Return the values under ``key`` as Arrow arrays.
+
+    Normally this is one typed array. A key that mixes numbers with other
+    values is split into a string array and a numeric array, each null where
+    the other holds the value, so converters still see numbers as numbers
+    (e.g. epoch-millisecond dates next to date strings).
+    """
+
+    values = [attrs.get(key) for attrs in attributes]
+    try:
+        return [pyarrow.array(values)]
+    except (pyarrow.ArrowInvalid, pyarrow.ArrowTypeError):
+        pass
+    text = pyarrow.array(
+        [None if value is None or _is_number(value) else str(value) for value in values], type=pyarrow.string()
+    )
+    try:
+        numbers = pyarrow.array([value if _is_number(value) else None for value in values])
+    except (pyarrow.ArrowInvalid, pyarrow.ArrowTypeError, OverflowError):
+        # Numbers Arrow cannot hold (e.g. beyond int64); keep everything as text.
+        return [pyarrow.array([None if v is None else str(v) for v in values], type=pyarrow.string())]
+    return [text, numbers]
+
+
+def _arrow_to_string(modules: Tuple[Any, Any, Any], array: Any) -> Any:
+    pyarrow, compute, _ = modules
+    return array if pyarrow.types.is_string(array.type) else compute.cast(array, pyarrow.string())
+
+
+def _arrow_to_float(modules: Tuple[Any, Any, Any], array: Any) -> Any:
+    pyarrow, compute, _ = modules
+    if pyarrow.types.is_string(array.type):
+        text = compute.utf8_trim_whitespace(array)
+        numeric = compute.match_substring_regex(text, _NUMBER_PATTERN)
+        array = compute.if_else(numeric, text, pyarrow.scalar(None, pyarrow.string()))
+    numbers = compute.cast(array, pyarrow.float64())
+    return compute.if_else(compute.is_nan(numbers), pyarrow.scalar(None, pyarrow.float64()), numbers)
+
+
+def _arrow_to_date(modules: Tuple[Any, Any, Any], array: Any) -> Any:
+    pyarrow, compute, _ = modules
+    if pyarrow.types.is_string(array.type):
+        text = compute.utf8_trim_whitespace(array)
+        parsed = compute.coalesce(
+            *(compute.strptime(text, format=fmt, unit="s", error_is_null=True) for fmt in DATE_FORMATS)
+        )
+        return compute.cast(parsed, pyarrow.date32())
+    # ArcGIS services often return epoch milliseconds
+    millis = compute.cast(array, pyarrow.int64(), safe=False)
+    return compute.cast(compute.cast(millis, pyarrow.timestamp("ms")), pyarrow.date32())
+
+
+def _arrow_first_present(
+    modules: Tuple[Any, Any, Any],
+    attributes: List[MutableMapping[str, Any]],
+    keys: Iterable[str],
+    convert: Any,
+    out_type: Any,
+) -> Any:
+    """Vectorized counterpart of the ``_PICKERS`` lookup, followed by ``convert``.
+
+    As in the row-wise path, the first non-empty key decides the value even if
+    it then fails to convert.
+    """
+
+    pyarrow, compute, _ = modules
+    result = pyarrow.nulls(len(attributes), out_type)
+    decided = pyarrow.array([False] * len(attributes))
+    for key in keys:
+        # Split arrays of one key never overlap, so taking them in turn is safe.
+        for array in _attribute_arrays(pyarrow, attributes, key):
+            if array.null_count == len(array):
+                continue
+            present = compute.is_valid(array)
+            if pyarrow.types.is_string(array.type):
+                present = compute.fill_null(compute.and_kleene(present, compute.not_equal(array, "")), False)
+            take = compute.and_(present, compute.invert(decided))
+            result = compute.if_else(take, convert(modules, array), result)
+            decided = compute.or_(decided, present)
+    return result
+
+
+def normalize_features_table(features: List[Dict[str, Any]], modules: Tuple[Any, Any, Any]) -> Any:
+    """Columnar counterpart of :func:`normalize_features` built with pyarrow.compute.
+
+    Returns a table with :func:`normalized_arrow_schema`. Identifier columns
+    are always strings and ``inspection_date`` is a ``date32`` column.
+    """
+
+    pyarrow = modules[0]
+    attributes = [feature.get("attributes") or {} for feature in features]
+    geometries = [feature.get("geometry") or {} for feature in features]
+    columns = {
+        column: _arrow_first_present(modules, attributes, _FIELD_KEYS[column], _arrow_to_string, pyarrow.string())
+        for column in ("structure_id", "state_code", "county_code", "element_code")
+    }
+    columns["condition_rating"] = _arrow_first_present(
+        modules, attributes, _FIELD_KEYS["condition_rating"], _arrow_to_float, pyarrow.float64()
+    )
+    columns["inspection_date"] = _arrow_first_present(
+        modules, attributes, _FIELD_KEYS["inspection_date"], _arrow_to_date, pyarrow.date32()
+    )
+    columns["latitude"] = pyarrow.array(
+        [_coerce_float(geom.get("y") or geom.get("lat")) for geom in geometries], type=pyarrow.float64()
+    )
+    columns["longitude"] = pyarrow.array(
+        [_coerce_float(geom.get("x") or geom.get("lon")) for geom in geometries], type=pyarrow.float64()
+    )
+    return pyarrow.Table.from_pydict(columns, schema=normalized_arrow_schema(pyarrow))
+
+
+class GeoJSONStreamWriter:
+    """Write a GeoJSON FeatureCollection incrementally, one batch at a time."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._handle: Optional[IO[bytes]] = None
+        self._empty = True
+
+    def __enter__(self) -> "GeoJSONStreamWriter":
+        self._handle = self.path.open("wb")
+        self._handle.write(b'{"type": "FeatureCollection", "features": [')
+        return self
+
+    def write(self, features: Iterable[Dict[str, Any]]) -> None:
+        assert self._handle is not None, "GeoJSONStreamWriter used outside of a with block"
+        for feature in features:
+            self._handle.write(b"\n" if self._empty else b",\n")
+            self._handle.write(_dumps(feature, indent=True))
+            self._empty = False
+
+    def __exit__(self, *exc_info: Any) -> None:
+        assert self._handle is not None
+        self._handle.write(b"\n]}\n")
+        self._handle.close()
+        self._handle = None
+
+
+def _load_pyarrow(path: Path) -> Optional[Tuple[Any, Any]]:
     pyarrow_spec = importlib.util.find_spec("pyarrow")
     if pyarrow_spec is None:
         logging.warning("pyarrow not installed; skipping Parquet export at %s", path)
@@ -197,20 +543,141 @@ def write_parquet(records: List[Dict[str, Any]], path: Path) -> Optional[Path]:
         logging.warning("pyarrow.parquet unavailable; skipping Parquet export at %s", path)
         return None
 
-    pyarrow = importlib.import_module("pyarrow")
-    parquet = importlib.import_module("pyarrow.parquet")
+    return importlib.import_module("pyarrow"), importlib.import_module("pyarrow.parquet")
+
+
+class ParquetStreamWriter:
+    """Append record batches to a single Parquet file.
+
+    The schema is taken from the first non-empty batch, with all-null columns
+    widened to strings. Each later batch is inferred per column and cast to
+    that schema with ``safe=True``, so lossy conversions raise instead of
+    silently truncating. If a batch does not fit, the column is promoted (int
+    to double, anything else to string) and the rows written so far are
+    rewritten under the wider schema. When pyarrow is unavailable every call
+    is a no-op and :attr:`written_path` stays ``None``.
+    """
 
-    table = pyarrow.Table.from_pylist(records)
-    parquet.write_table(table, path)
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._modules = _load_pyarrow(path)
+        self._writer: Any = None
+        self._schema: Any = None
+
+    @property
+    def written_path(self) -> Optional[Path]:
+        return self.path if self._writer is not None else None
+
+    def __enter__(self) -> "ParquetStreamWriter":
+        return self
+
+    def _infer(self, values: List[Any]) -> Any:
+        pyarrow = self._modules[0]
+        try:
+            return pyarrow.array(values)
+        except (pyarrow.ArrowInvalid, pyarrow.ArrowTypeError):
+            # Mixed types under one key; keep them as their string forms.
+            return pyarrow.array([None if v is None else str(v) for v in values], type=pyarrow.string())
+
+    def _promoted_type(self, current: Any, incoming: Any) -> Any:
+        types = self._modules[0].types
+        if types.is_null(incoming) or incoming == current:
+            return current
+        if types.is_integer(current) and types.is_floating(incoming):
+            return incoming
+        if types.is_floating(current) and types.is_integer(incoming):
+            return current
+        return self._modules[0].string()
+
+    def _widen(self, schema: Any) -> None:
+        """Reopen the file under ``schema``, carrying over what was written."""
+
+        pyarrow, parquet = self._modules
+        logging.warning("Widening Parquet schema of %s to %s", self.path, schema)
+        self._writer.close()
+        written = parquet.read_table(self.path)
+        written = pyarrow.Table.from_arrays(
+            [column.cast(field.type, safe=True) for column, field in zip(written.columns, schema)],
+            schema=schema,
+        )
+        self._schema = schema
+        self._writer = parquet.ParquetWriter(self.path, schema)
+        self._writer.write_table(written)
+
+    def write(self, records: List[Dict[str, Any]]) -> None:
+        if self._modules is None or not records:
+            return
+        pyarrow, parquet = self._modules
+        names = self._schema.names if self._schema is not None else list(records[0])
+        arrays = []
+        for name in names:
+            values = [record.get(name) for record in records]
+            if self._schema is not None and pyarrow.types.is_string(self._schema.field(name).type):
+                values = [value if value is None or isinstance(value, str) else str(value) for value in values]
+            arrays.append(self._infer(values))
+
+        if self._schema is None:
+            self._schema = pyarrow.schema(
+                [
+                    pyarrow.field(name, pyarrow.string() if pyarrow.types.is_null(array.type) else array.type)
+                    for name, array in zip(names, arrays)
+                ]
+            )
+            self._writer = parquet.ParquetWriter(self.path, self._schema)
+        else:
+            widened = pyarrow.schema(
+                [field.with_type(self._promoted_type(field.type, array.type)) for field, array in zip(self._schema, arrays)]
+            )
+            if not widened.equals(self._schema):
+                self._widen(widened)
+
+        for idx, field in enumerate(self._schema):
+            array = arrays[idx]
+            if array.type == field.type:
+                continue
+            if pyarrow.types.is_string(field.type) and not pyarrow.types.is_null(array.type):
+                array = pyarrow.array([None if v is None else str(v) for v in array.to_pylist()], type=field.type)
+            arrays[idx] = array.cast(field.type, safe=True)
+        self._writer.write_table(pyarrow.Table.from_arrays(arrays, schema=self._schema))
+
+    def __exit__(self, *exc_info: Any) -> None:
+        if self._writer is not None:
+            self._writer.close()
+
+
+def write_geojson(features: List[Dict[str, Any]], path: Path) -> Path:
+    with GeoJSONStreamWriter(path) as writer:
+        writer.write(features)
     return path
 
 
+def write_parquet(records: List[Dict[str, Any]], path: Path) -> Optional[Path]:
+    with ParquetStreamWriter(path) as writer:
+        writer.write(records)
+    return writer.written_path
+
+
+_ROW_VALUES = operator.itemgetter(*NORMALIZED_COLUMNS)
+
+
+def _csv_values(row: Dict[str, Any]) -> Tuple[Any, ...]:
+    try:
+        return _ROW_VALUES(row)
+    except KeyError:
+        # Rows from normalize_features always carry every column; tolerate
+        # hand-built rows that do not.
+        return tuple(row.get(col) for col in NORMALIZED_COLUMNS)
+
+
+def _write_csv_rows(writer: Any, rows: Iterable[Dict[str, Any]]) -> None:
+    writer.writerows(map(_csv_values, rows))
+
+
 def write_csv(rows: List[Dict[str, Any]], path: Path) -> Path:
     with path.open("w", newline="", encoding="utf-8") as csvfile:
-        writer = csv.DictWriter(csvfile, fieldnames=NORMALIZED_COLUMNS)
-        writer.writeheader()
-        for row in rows:
-            writer.writerow({col: row.get(col) for col in NORMALIZED_COLUMNS})
+        writer = csv.writer(csvfile)
+        writer.writerow(NORMALIZED_COLUMNS)
+        _write_csv_rows(writer, rows)
     return path
 
 
@@ -233,36 +700,77 @@ def summarize_schema(rows: List[Dict[str, Any]]) -> SchemaSummary:
     return summary
 
 
+def summarize_table_schema(table: Any) -> SchemaSummary:
+    """:func:`summarize_schema` for a :func:`normalize_features_table` result."""
+
+    fields: Dict[str, Dict[str, Any]] = {}
+    for name in table.column_names:
+        column = table.column(name).drop_null()
+        example = column[0].as_py() if len(column) else None
+        if isinstance(example, dt.date):
+            example = example.isoformat()
+        fields[name] = {
+            "types": [type(example).__name__] if example is not None else [],
+            "non_null": len(column),
+            "example": example,
+        }
+    return {"record_count": table.num_rows, "fields": fields}
+
+
+def merge_schema_summaries(total: SchemaSummary, part: SchemaSummary) -> SchemaSummary:
+    """Fold the summary of one batch into a running summary, in place."""
+
+    total["record_count"] += part["record_count"]
+    for column, stats in part["fields"].items():
+        merged = total["fields"].setdefault(column, {"types": [], "non_null": 0, "example": None})
+        merged["types"] = sorted(set(merged["types"]) | set(stats["types"]))
+        merged["non_null"] += stats["non_null"]
+        if merged["example"] is None:
+            merged["example"] = stats["example"]
+    return total
+
+
+def _raw_parquet_records(features: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    parquet_records = []
+    for feature in features:
+        record = dict(feature.get("attributes") or {})
+        geometry = feature.get("geometry")
+        record["geometry"] = _dumps(geometry).decode("utf-8") if geometry is not None else None
+        parquet_records.append(record)
+    return parquet_records
+
+
 def archive_raw(
     features: List[Dict[str, Any]],
     raw_dir: Path,
     prefix: str,
+    stamp: Optional[str] = None,
 ) -> Dict[str, Optional[Path]]:
     raw_dir.mkdir(parents=True, exist_ok=True)
-    stamp = _timestamp_tag()
+    stamp = stamp or _timestamp_tag()
     paths: Dict[str, Optional[Path]] = {}
 
-    geojson_path = raw_dir / f"{prefix}_{stamp}.geojson"
+    geojson_path = _artifact_path(raw_dir, prefix, "geojson", stamp)
     paths["geojson"] = write_geojson(features, geojson_path)
 
-    parquet_records = []
-    for feature in features:
-        record = dict(feature.get("attributes") or {})
-        geometry = feature.get("geometry")
-        record["geometry"] = json.dumps(geometry) if geometry is not None else None
-        parquet_records.append(record)
-
-    parquet_path = raw_dir / f"{prefix}_{stamp}.parquet"
-    paths["parquet"] = write_parquet(parquet_records, parquet_path)
+    parquet_path = _artifact_path(raw_dir, prefix, "parquet", stamp)
+    paths["parquet"] = write_parquet(_raw_parquet_records(features), parquet_path)
     return paths
 
 
-def persist_processed(rows: List[Dict[str, Any]], processed_dir: Path, prefix: str) -> Dict[str, Path]:
+def persist_processed(
+    rows: List[Dict[str, Any]],
+    processed_dir: Path,
+    prefix: str,
+    stamp: Optional[str] = None,
+) -> Dict[str, Path]:
+    # Pass the stamp used for archive_raw so raw and processed files of one
+    # run share it.
     processed_dir.mkdir(parents=True, exist_ok=True)
-    stamp = _timestamp_tag()
+    stamp = stamp or _timestamp_tag()
 
-    csv_path = processed_dir / f"{prefix}_clean_{stamp}.csv"
-    schema_path = processed_dir / f"{prefix}_schema_{stamp}.json"
+    csv_path = _artifact_path(processed_dir, prefix, "csv", stamp)
+    schema_path = _artifact_path(processed_dir, prefix, "schema", stamp)
 
     write_csv(rows, csv_path)
     schema = summarize_schema(rows)
@@ -296,11 +804,22 @@ def parse_args() -> argparse.Namespace:
         default=None,
         help="Cap the number of features to fetch (useful for smoke tests).",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=8,
+        help="Number of API pages to fetch concurrently (1 fetches serially).",
+    )
     parser.add_argument(
         "--prefix",
         default=RAW_FILENAME,
         help="Filename prefix for emitted artifacts.",
     )
+    parser.add_argument(
+        "--columnar",
+        action="store_true",
+        help="Normalize with pyarrow.compute and write the CSV with pyarrow (requires pyarrow).",
+    )
     return parser.parse_args()
 
 
@@ -308,18 +827,56 @@ def main() -> None:
     logging.basicConfig(level=logging.INFO, format="%(levelname)s:%(message)s")
     args = parse_args()
 
-    logging.info("Fetching bridge inventory from %s", args.service_url)
-    features = fetch_features(args.service_url, batch_size=args.batch_size, max_features=args.max_features)
-    logging.info("Fetched %d features", len(features))
-
     raw_dir = args.out_dir / "raw"
     processed_dir = args.out_dir / "processed"
+    raw_dir.mkdir(parents=True, exist_ok=True)
+    processed_dir.mkdir(parents=True, exist_ok=True)
 
-    archives = archive_raw(features, raw_dir=raw_dir, prefix=args.prefix)
-    logging.info("Raw artifacts saved: %s", {k: str(v) for k, v in archives.items()})
+    stamp = _timestamp_tag()
+    geojson_path = _artifact_path(raw_dir, args.prefix, "geojson", stamp)
+    parquet_path = _artifact_path(raw_dir, args.prefix, "parquet", stamp)
+    csv_path = _artifact_path(processed_dir, args.prefix, "csv", stamp)
+    schema_path = _artifact_path(processed_dir, args.prefix, "schema", stamp)
 
-    normalized = normalize_features(features)
-    processed_paths = persist_processed(normalized, processed_dir=processed_dir, prefix=args.prefix)
+    # Each page is archived, normalized and written before the next one is
+    # fetched, so peak memory is bounded by the batch size.
+    logging.info("Fetching bridge inventory from %s", args.service_url)
+    schema = summarize_schema([])
+    fetched = 0
+    columnar = _load_pyarrow_compute() if args.columnar else None
+    with contextlib.ExitStack() as stack:
+        geojson = stack.enter_context(GeoJSONStreamWriter(geojson_path))
+        parquet = stack.enter_context(ParquetStreamWriter(parquet_path))
+        if columnar is None:
+            csv_writer = csv.writer(stack.enter_context(csv_path.open("w", newline="", encoding="utf-8")))
+            csv_writer.writerow(NORMALIZED_COLUMNS)
+        else:
+            arrow_writer = stack.enter_context(
+                columnar[2].CSVWriter(str(csv_path), normalized_arrow_schema(columnar[0]))
+            )
+        for batch in iter_feature_batches(
+            args.service_url,
+            batch_size=args.batch_size,
+            max_features=args.max_features,
+            max_workers=args.workers,
+        ):
+            geojson.write(batch)
+            parquet.write(_raw_parquet_records(batch))
+            if columnar is None:
+                rows = normalize_features(batch)
+                _write_csv_rows(csv_writer, rows)
+                merge_schema_summaries(schema, summarize_schema(rows))
+            else:
+                table = normalize_features_table(batch, columnar)
+                arrow_writer.write_table(table)
+                merge_schema_summaries(schema, summarize_table_schema(table))
+            fetched += len(batch)
+    schema_path.write_text(json.dumps(schema, indent=2))
+    logging.info("Fetched %d features", fetched)
+
+    archives = {"geojson": geojson_path, "parquet": parquet.written_path}
+    logging.info("Raw artifacts saved: %s", {k: str(v) for k, v in archives.items()})
+    processed_paths = {"csv": csv_path, "schema": schema_path}
     logging.info("Processed outputs saved: %s", {k: str(v) for k, v in processed_paths.items()})
 
 